@@ -9,6 +9,7 @@ import argparse
 from tensornetworkrg import rg3d_pres as rg3d
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from runLog import RunLog
 
 # argument parser
 argdesp = ("Find critical temperature given---" +
@@ -41,6 +42,9 @@ parser.add_argument("--Thi", type=float,
 parser.add_argument("--isParal",
                     help="whether to use parallel computation codes",
                     action="store_true")
+parser.add_argument("--logFile", type=str,
+                    help="JSON-lines file for the structured run log",
+                    default=None)
 
 # for block-tensor RG
 parser.add_argument("--chiM", type=int,
@@ -88,6 +92,7 @@ rg_n = args.rgn
 iter_n = args.itern
 outDir = args.outDir
 isParal = args.isParal
+logFile = args.logFile
 
 
 # for block-tensor RG bond dimensions
@@ -155,11 +160,23 @@ if rank == 0:
     print("    Max RG steps is --{:d}--".format(rg_n))
     print("    Bisection iteration number is --{:d}--".format(iter_n))
     print("----------------------------------")
+runlog = RunLog(logFile, comm)
+runlog.log("start", script="bisectTc", scheme=scheme, ver=ver,
+           Tlow=Tlow, Thi=Thi, itern=iter_n, pars=pars,
+           nranks=1 if comm is None else comm.Get_size())
 # find Tc
-rg3d.findTc(iter_n, Tlow, Thi,
-            scheme, ver,
-            pars, outDir,
-            comm=comm)
+status = "error"
+try:
+    rg3d.findTc(iter_n, Tlow, Thi,
+                scheme, ver,
+                pars, outDir,
+                comm=comm)
+    status = "ok"
+except BaseException as err:
+    runlog.log("error", errType=type(err).__name__, message=str(err))
+    raise
+finally:
+    runlog.finish(status=status)
 
 if rank == 0:
     now = datetime.now()
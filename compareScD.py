@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : compareScD.py
+# Author            : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+# Last Modified By  : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+"""
+Compare scaling dimensions of several runs with different
+bond dimensions (χ, χ_s, χ_M, χ_Ms)
+"""
+import argparse
+import tensornetworkrg.rg3d_pres as rg3d
+import scDimPlot
+
+# argument parser
+argdesp = ("Compare scaling dimensions of several runs")
+parser = argparse.ArgumentParser(description=argdesp)
+parser.add_argument("--scheme", type=str,
+                    help="TNRG scheme (default is --blockHOTRG--)",
+                    default="blockHOTRG")
+parser.add_argument("--ver", type=str,
+                    help="TNRG scheme version (default is --base--)",
+                    default="base")
+parser.add_argument("--runs", type=str, nargs="+",
+                    help="bond dimensions of each run as chi,chis,chiM,chiMs",
+                    required=True)
+parser.add_argument("--startn", type=int,
+                    help="starting RG step (default: 0)",
+                    default=0)
+parser.add_argument("--endn", type=int,
+                    help="ending RG step (default: None)",
+                    default=None)
+parser.add_argument("--rgn", type=int,
+                    help="RG step for error-vs-chi (default: last step)",
+                    default=None)
+parser.add_argument("--outDir", type=str,
+                    help="output directory for the comparison figures",
+                    default="./")
+
+# read argument
+args = parser.parse_args()
+scheme = args.scheme
+ver = args.ver
+runs = args.runs
+startn = args.startn
+endn = args.endn
+rgn = args.rgn
+outDir = args.outDir
+
+# read scaling dimensions data of all runs
+runRows = []
+labels = []
+chiList = []
+for run in runs:
+    chi, chis, chiM, chiMs = [int(x) for x in run.split(",")]
+    saveDir = rg3d.saveDirName(
+        scheme, ver, {"chi": chi, "chis": chis, "chiM": chiM, "chiMs": chiMs},
+        "./", None
+    )
+    tenDir = rg3d.tensorsDir(saveDir)
+    rows, rgsteps = scDimPlot.sliceRG(
+        scDimPlot.loadScDimRows(tenDir), startn, endn
+    )
+    if len(rgsteps) == 0:
+        raise ValueError(
+            "Run {:s} has no RG step for --startn {} --endn {}".format(
+                run, startn, endn)
+        )
+    runRows.append(rows)
+    labels.append(r"$\chi$={:d}, $\chi_s$={:d}, $\chi_M$={:d}".format(
+        chi, chis, chiM))
+    chiList.append(chi)
+
+# ---PLOT and save the figures---
+fig = scDimPlot.plotCompare(runRows, labels)
+fig.savefig(outDir + "/scDimCompare.png",
+            bbox_inches='tight', dpi=300)
+
+errs = scDimPlot.errSummary(runRows, rgn=rgn)
+for run, (eErr, sErr) in zip(runs, errs):
+    print("(chi,chis,chiM,chiMs)=({:s}): ".format(run) +
+          "ε error {:.2%}, σ error {:.2%}".format(eErr, sErr))
+fig = scDimPlot.plotErrVsChi(chiList, errs, labels)
+fig.savefig(outDir + "/scDimErrVsChi.png",
+            bbox_inches='tight', dpi=300)
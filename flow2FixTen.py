@@ -9,6 +9,7 @@ import argparse
 from tensornetworkrg import rg3d_pres as rg3d
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from runLog import RunLog
 
 
 # argument parser
@@ -35,6 +36,9 @@ parser.add_argument("--plotRGmax", type=int,
 parser.add_argument("--isParal",
                     help="whether to use parallel computation codes",
                     action="store_true")
+parser.add_argument("--logFile", type=str,
+                    help="JSON-lines file for the structured run log",
+                    default=None)
 
 # for block-tensor RG
 parser.add_argument("--chiM", type=int,
@@ -82,6 +86,7 @@ rg_n = args.rgn
 outDir = args.outDir
 plotRGmax = args.plotRGmax
 isParal = args.isParal
+logFile = args.logFile
 
 # for block-tensor RG bond dimensions
 chiM = args.chiM
@@ -149,9 +154,20 @@ if rank == 0:
     print("    Bond dimension is --{:d}--".format(chi))
     print("    RG steps is --{:d}--".format(rg_n))
     print("----------------------------------")
-rg3d.generateRGflow(scheme, ver, pars,
-                    outDir, plotRGmax,
-                    comm=comm)
+runlog = RunLog(logFile, comm)
+runlog.log("start", script="flow2FixTen", scheme=scheme, ver=ver,
+           pars=pars, nranks=1 if comm is None else comm.Get_size())
+status = "error"
+try:
+    rg3d.generateRGflow(scheme, ver, pars,
+                        outDir, plotRGmax,
+                        comm=comm)
+    status = "ok"
+except BaseException as err:
+    runlog.log("error", errType=type(err).__name__, message=str(err))
+    raise
+finally:
+    runlog.finish(status=status)
 if rank == 0:
     now = datetime.now()
     current_time = now.strftime("%Y-%m-%d. %H:%M:%S")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : runLog.py
+# Author            : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+# Last Modified By  : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+"""
+Structured run log (JSON lines) for long TNRG jobs
+
+Each event is one JSON object per line and is flushed immediately.
+Only rank 0 writes the file.
+For now a job logs a "start", an optional "error" and a "finish" event;
+per-RG-step progress is not logged yet.
+"""
+import json
+import math
+import resource
+import socket
+import sys
+import time
+from datetime import datetime
+
+
+def peakMemMB():
+    """Peak resident memory of the current process in MB
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / 1024**2
+    return peak / 1024
+
+
+def finite2json(obj):
+    """Replace NaN and inf by None so that every line is valid JSON
+    """
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: finite2json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [finite2json(v) for v in obj]
+    return obj
+
+
+class RunLog:
+    """JSON-lines event writer
+
+    Args:
+        fname (str): path of the log file; None disables the log
+        comm (MPI.COMM_WORLD or None): for the parallelization
+
+    Every rank should construct it and call `finish`, since
+    a successful `finish` gathers per-rank statistics;
+    only rank 0 actually writes to the file.
+    """
+    def __init__(self, fname, comm=None):
+        self.comm = comm
+        self.rank = 0 if comm is None else comm.Get_rank()
+        self.isOn = (fname is not None) and (self.rank == 0)
+        self.isFinished = False
+        self.start = time.time()
+        if self.isOn:
+            self._file = open(fname, "a")
+
+    def log(self, event, **fields):
+        """Write an event to the log file
+        """
+        if not self.isOn or self.isFinished:
+            return
+        record = {"event": event,
+                  "time": datetime.now().isoformat(timespec="seconds"),
+                  "elapsed": round(time.time() - self.start, 3)}
+        record.update(fields)
+        self._file.write(json.dumps(finite2json(record), default=str,
+                                    allow_nan=False) + "\n")
+        self._file.flush()
+
+    def finish(self, status="ok", **fields):
+        """Log the "finish" event and close the log
+
+        For status "ok", this is a collective call when `comm` is not None.
+        Otherwise only the statistics of the current rank are logged,
+        since the other ranks may never reach this point.
+        Calling it more than once has no effect.
+        """
+        if self.isFinished:
+            return
+        stats = {"host": socket.gethostname(),
+                 "peakMemMB": round(peakMemMB(), 1),
+                 "elapsed": round(time.time() - self.start, 3)}
+        if self.comm is not None and status == "ok":
+            allStats = self.comm.gather(stats, root=0)
+        else:
+            allStats = [stats]
+        if self.isOn:
+            self.log("finish", status=status, nranks=len(allStats),
+                     maxPeakMemMB=max(s["peakMemMB"] for s in allStats),
+                     ranks=allStats, **fields)
+            self._file.close()
+        self.isFinished = True
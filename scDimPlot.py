@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# File              : scDimPlot.py
+# Author            : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+# Date              : 19.10.2026
+# Last Modified Date: 19.10.2026
+# Last Modified By  : Xinliang(Bruce) Lyu <lyu@issp.u-tokyo.ac.jp>
+"""
+Plotting of scaling dimensions from the linearized RG map
+
+The scaling dimensions of a run, saved in `scDimSep.pkl`,
+are flattened into one array with rows
+    (rgn, sector, spin, level, value),
+where `sector` indexes `SECTORS` and `spin` is 0 (even) or 1 (odd).
+This array is cached next to `scDimSep.pkl` as `scDimRows.npy`,
+and each lattice-reflection sector is drawn with a single scatter call.
+"""
+import os
+import pickle as pkl
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.markers import MarkerStyle
+
+# lattice-reflection sectors in the order of `scDimSep.pkl`
+SECTORS = ["000", "100", "010", "001", "110", "101", "011"]
+# sector class: 0 for (000), 1 for (100) and alikes, 2 for (110) and alikes
+SECTORCLASS = [0, 1, 1, 1, 2, 2, 2]
+# horizontal shift of each sector relative to the RG step
+SECTORSHIFT = [0, 0.2 - 0.05, 0.2, 0.2 + 0.05,
+               0.35 - 0.05, 0.35, 0.35 + 0.05]
+
+# (markers, colors, shifts) of each level,
+# for [spin-flip EVEN, ODD] x [sector class 0, 1, 2]
+STYLES = [
+    [
+        ([".", "*", "s", "s", "x", "x", "x"],
+         ["k", "k", "k", "k", "b", "b", "b"],
+         [0, 0, -0.03, 0.03, -0.03, 0, 0.03]),
+        (["+", "1", "1"], ["b", "b", "b"], [0, -0.01, 0.01]),
+        (["s", "x"], ["k", "b"], [0, 0]),
+    ],
+    [
+        ([".", "x", "x", "x"], ["k", "b", "b", "b"], [0, -0.03, 0, 0.03]),
+        (["+", "1", "1", "1"], ["b", "b", "b", "b"], [0, -0.03, 0, 0.03]),
+        (["x"], ["b"], [0]),
+    ],
+]
+# number of levels plotted in each sector class, for [EVEN, ODD]
+NUMPLOT = [[7, 3, 2], [4, 4, 1]]
+
+# best-known (conformal bootstrap) values and their line colors
+BESTVALS = [
+    ([1.412625, 2.412625, 3, 3.412625, 4.000000],
+     ["black", "blue", "black", "blue", "blue"]),
+    ([0.5181489, 1.5181489, 2.5181489, 3.5181489],
+     ["black", "blue", "blue", "blue"]),
+]
+# primary field of each spin-flip sector: (name, level in (000), best value)
+PRIMARY = [(r"$\epsilon$", 1, 1.412625), (r"$\sigma$", 0, 0.5181489)]
+
+
+def scDim2rows(rgsteps, scDList):
+    """Flatten the content of `scDimSep.pkl` into an array
+
+    Returns:
+        rows (ndarray): shape (n, 5) with columns
+            (rgn, sector, spin, level, value)
+    """
+    rows = []
+    for rgn, scD in zip(rgsteps, scDList):
+        for sector, scDsec in enumerate(scD):
+            for spin, vals in enumerate(scDsec):
+                for level, val in enumerate(vals):
+                    rows.append((rgn, sector, spin, level, val))
+    return np.array(rows, dtype=float).reshape(-1, 5)
+
+
+def loadScDimRows(tenDir, comm=None):
+    """Read scaling dimensions of a run as a row array
+
+    The array is cached as `scDimRows.npy` in `tenDir`
+    and rebuilt whenever `scDimSep.pkl` is newer than the cache.
+    Only rank 0 writes the cache, through a temporary file
+    that replaces the old cache in one step.
+    """
+    scDFile = tenDir + "/scDimSep.pkl"
+    cacheFile = tenDir + "/scDimRows.npy"
+    if (os.path.exists(cacheFile) and
+            os.path.getmtime(cacheFile) >= os.path.getmtime(scDFile)):
+        return np.load(cacheFile)
+    with open(scDFile, "rb") as f:
+        rgsteps, scDList = pkl.load(f)
+    rows = scDim2rows(rgsteps, scDList)
+    if comm is None or comm.Get_rank() == 0:
+        tmpFile = "{:s}.{:d}.tmp".format(cacheFile, os.getpid())
+        with open(tmpFile, "wb") as f:
+            np.save(f, rows)
+        os.replace(tmpFile, cacheFile)
+    return rows
+
+
+def sliceRG(rows, startn=0, endn=None):
+    """Keep the RG steps `startn:endn` of the run
+    """
+    rgsteps = np.unique(rows[:, 0])[startn:endn]
+    return rows[np.isin(rows[:, 0], rgsteps)], rgsteps.astype(int)
+
+
+def scatterMarkers(figax, x, y, colors, markers, s=36):
+    """A single scatter call with a different marker for each point
+    """
+    sc = figax.scatter(x, y, s=s, c=list(colors))
+    paths = []
+    for m in markers:
+        mstyle = MarkerStyle(m)
+        paths.append(mstyle.get_path().transformed(mstyle.get_transform()))
+    sc.set_paths(paths)
+    return sc
+
+
+def primaryErr(rows, spinchg):
+    """Relative error of the primary field in a spin-flip sector
+
+    Returns:
+        rgsteps, estimates, relative errors (ndarray)
+    """
+    level, best = PRIMARY[spinchg][1:]
+    sel = rows[(rows[:, 1] == 0) & (rows[:, 2] == spinchg) &
+               (rows[:, 3] == level)]
+    return sel[:, 0], sel[:, 4], np.abs(sel[:, 4] - best) / best
+
+
+def plotSpinSector(figax, rows, spinchg=0, isErrText=True):
+    """Plot all lattice-reflection sectors in a spin-flip sector
+    """
+    numPlot = NUMPLOT[spinchg]
+    for sector, shift in enumerate(SECTORSHIFT):
+        sclass = SECTORCLASS[sector]
+        markers, colors, shifts = STYLES[spinchg][sclass]
+        sel = rows[(rows[:, 1] == sector) & (rows[:, 2] == spinchg) &
+                   (rows[:, 3] < numPlot[sclass])]
+        if len(sel) == 0:
+            continue
+        level = sel[:, 3].astype(int)
+        x = sel[:, 0] + shift + np.asarray(shifts)[level]
+        scatterMarkers(figax, x, sel[:, 4],
+                       np.asarray(colors)[level], np.asarray(markers)[level])
+    # Relative error of the primary field (ε or σ)
+    if isErrText:
+        for rgn, est, err in zip(*primaryErr(rows, spinchg)):
+            figax.text(rgn + 0.06, est, "{:.1%}".format(err), size=14)
+
+
+def plotBestVals(figax, rgsteps, spinchg=0):
+    """Dashed lines for best-known values
+    """
+    vals, colors = BESTVALS[spinchg]
+    figax.hlines(vals, rgsteps[0] - 0.2, rgsteps[-1] + 0.5,
+                 colors=colors, linestyles="dashed", alpha=0.2)
+
+
+def plotScDim(rows, rgsteps, chi):
+    """Scaling dimensions versus RG step of a single run
+    """
+    arrowpps = dict(arrowstyle="->", alpha=0.2, color='blue')
+    shift010 = SECTORSHIFT[2]
+    shift110 = SECTORSHIFT[4]
+    shift011 = SECTORSHIFT[6]
+    fig = plt.figure(figsize=(12, 8))
+
+    # I. Spin-flip EVEN
+    ax1 = fig.add_subplot(211)
+    plotSpinSector(ax1, rows, spinchg=0)
+    plotBestVals(ax1, rgsteps, spinchg=0)
+    ax1.set_xticks(rgsteps)
+    if len(rgsteps) == 1:
+        ax1.set_xlim([rgsteps[0] - 1, rgsteps[0] + 1])
+    ax1.set_ylim([-0.1, 3.4])
+    ax1.set_ylabel("Even sector")
+    # Put explanations on the figure
+    ax1.text(rgsteps[0] - 0.06, 1.41 + 0.10, r"$\epsilon$", size=14)
+    ax1.text(rgsteps[0] - 0.15, 3 + 0.10, r"$T_{kk}$", size=14)
+    ax1.text(rgsteps[0] + shift011 + 0.03, 3 + 0.10, r"$T_{mn}$", size=14)
+    # 1) 1st descendant of ε
+    ax1.annotate("", xy=(rgsteps[0] + shift010, 2.41 - 0.02),
+                 xytext=(rgsteps[0], 1.41 + 0.20),
+                 arrowprops=arrowpps)
+    ax1.text(rgsteps[0] + 0.15*shift010, 0.5*(1.41+2.41), r"$\partial_i$",
+             size=14, color="blue", alpha=0.2)
+    # 2) 1st descendant of Tkk
+    ax1.annotate("", xy=(rgsteps[0] + shift010, 4.00 - 0.02),
+                 xytext=(rgsteps[0], 3.00 + 0.10),
+                 arrowprops=arrowpps)
+    # bond dimension
+    ax1.text(rgsteps[-1] - 1, 0.5,
+             r"Bond dimension $\chi$={:d}".format(chi),
+             fontsize=14)
+
+    # II. Spin-flip ODD
+    ax2 = fig.add_subplot(212)
+    plotSpinSector(ax2, rows, spinchg=1)
+    plotBestVals(ax2, rgsteps, spinchg=1)
+    ax2.set_xticks(rgsteps)
+    ax2.set_ylim([-0.1, 3.0])
+    ax2.set_ylabel("Odd sector")
+    ax2.set_xlabel("RG step")
+    # Put explanations on the figure
+    ax2.text(rgsteps[0] - 0.06, 0.518 + 0.10, r"$\sigma$", size=14)
+    # 1) 1st descendant of σ
+    ax2.annotate("", xy=(rgsteps[0] + shift010, 1.518 - 0.02),
+                 xytext=(rgsteps[0], 0.518 + 0.10),
+                 arrowprops=arrowpps)
+    ax2.text(rgsteps[0] + 0.15*shift010, 0.5*(0.518+1.518), r"$\partial_i$",
+             size=14, color="blue", alpha=0.2)
+    # 2) 2nd descendant of σ
+    ax2.annotate("", xy=(rgsteps[0] + 0.06, 2.518 - 0.02),
+                 xytext=(rgsteps[0] + shift010, 1.518 + 0.10),
+                 arrowprops=arrowpps)
+    ax2.annotate("", xy=(rgsteps[0] + shift110 - 0.02, 2.518 - 0.02),
+                 xytext=(rgsteps[0] + shift010, 1.518 + 0.10),
+                 arrowprops=arrowpps)
+    return fig
+
+
+def plotCompare(runRows, labels):
+    """Grid of several runs: one row per run, [even, odd] columns
+
+    Args:
+        runRows (list): row arrays of the runs
+        labels (list): label of each run
+    """
+    nrun = len(runRows)
+    fig, axes = plt.subplots(nrun, 2, figsize=(14, 3 * nrun),
+                             sharey="col", squeeze=False)
+    ylims = [[-0.1, 3.4], [-0.1, 3.0]]
+    for rows, label, axrow in zip(runRows, labels, axes):
+        rgsteps = np.unique(rows[:, 0]).astype(int)
+        for spinchg, figax in enumerate(axrow):
+            plotSpinSector(figax, rows, spinchg=spinchg)
+            plotBestVals(figax, rgsteps, spinchg=spinchg)
+            figax.set_xticks(rgsteps)
+            figax.set_ylim(ylims[spinchg])
+        axrow[0].set_ylabel(label)
+    axes[0, 0].set_title("Even sector")
+    axes[0, 1].set_title("Odd sector")
+    axes[-1, 0].set_xlabel("RG step")
+    axes[-1, 1].set_xlabel("RG step")
+    fig.tight_layout()
+    return fig
+
+
+def errSummary(runRows, rgn=None):
+    """Relative errors of ε and σ for each run
+
+    Args:
+        runRows (list): row arrays of the runs
+        rgn (int): RG step to compare; None for the last step of each run
+
+    Returns:
+        errs (ndarray): shape (nrun, 2) with columns (ε error, σ error);
+            nan if the run does not contain the RG step
+    """
+    errs = np.full((len(runRows), 2), np.nan)
+    for n, rows in enumerate(runRows):
+        for spinchg in range(2):
+            rgsteps, _, err = primaryErr(rows, spinchg)
+            if len(rgsteps) == 0:
+                continue
+            curRG = rgsteps.max() if rgn is None else rgn
+            err = err[rgsteps == curRG]
+            if len(err) > 0:
+                errs[n, spinchg] = err[0]
+    return errs
+
+
+def plotErrVsChi(chiList, errs, labels):
+    """Relative errors of ε and σ versus bond dimension χ
+    """
+    chiList = np.asarray(chiList)
+    fig, figax = plt.subplots(figsize=(8, 5))
+    for spinchg, (color, marker) in enumerate([("k", "o"), ("b", "s")]):
+        figax.scatter(chiList, errs[:, spinchg], c=color, marker=marker,
+                      label=PRIMARY[spinchg][0])
+    for chi, err, label in zip(chiList, errs[:, 0], labels):
+        if np.isfinite(err):
+            figax.annotate(label, (chi, err), fontsize=8,
+                           xytext=(4, 4), textcoords="offset points")
+    figax.set_yscale("log")
+    figax.set_xticks(np.unique(chiList))
+    figax.set_xlabel(r"Bond dimension $\chi$")
+    figax.set_ylabel("Relative error")
+    figax.legend()
+    return fig